@@ -3,9 +3,24 @@
 # Project by https://github.com/rix1337
 
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
-from Cryptodome.Cipher import AES
+try:
+    # SIMD-accelerated drop-in for the stdlib base64 codec
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
+
+try:
+    # OpenSSL EVP dispatches to AES-NI at runtime and is noticeably faster
+    # than the generic software AES path for CBC.
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except ImportError:
+    Cipher = None
+    from Cryptodome.Cipher import AES
+
+import numpy as np
 from PIL import Image, ImageChops
 
 from quasarr.providers.log import info, debug
@@ -39,34 +54,46 @@ class CNL:
         if not self.jk or not self.crypted_blob:
             raise KeyError("Missing 'jk' or 'crypted' fields in JSON.")
 
+        # Cheap sanity checks before any base64/AES work is attempted
+        if len(self.crypted_blob) % 4:
+            raise ValueError("Invalid 'crypted' length; not Base64-aligned.")
+
         # Swap positions 15 and 16 in the hex string
         k_list = list(self.jk)
         if len(k_list) <= 16:
             raise ValueError("Invalid 'jk' string length; must be > 16 characters.")
+        if len(k_list) % 2:
+            raise ValueError("Invalid 'jk' string length; must be an even number of hex digits.")
         k_list[15], k_list[16] = k_list[16], k_list[15]
         self.fixed_key_hex = "".join(k_list)
 
-    def _aes_decrypt(self, data_b64: str, key_hex: str) -> bytes:
+        # Convert the key once at construction so malformed hex fails
+        # synchronously and _aes_decrypt can use the bytes directly
+        try:
+            self.key_bytes = bytes.fromhex(self.fixed_key_hex)
+        except Exception as e:
+            raise ValueError("Failed to convert key to bytes (invalid hex)") from e
+
+    def _aes_decrypt(self, data_b64: str) -> bytes:
         """
-        Decode the Base64‐encoded payload, interpret key_hex as hex,
-        then use AES-CBC with IV=key_bytes to decrypt.
+        Decode the Base64‐encoded payload, then use AES-CBC with
+        IV=key_bytes to decrypt.
         Returns raw bytes (still possibly containing padding).
         """
         try:
-            encrypted_data = base64.b64decode(data_b64)
+            encrypted_data = _b64.b64decode(data_b64)
         except Exception as e:
             raise ValueError("Failed to decode base64 data") from e
 
-        try:
-            key_bytes = bytes.fromhex(key_hex)
-        except Exception as e:
-            raise ValueError("Failed to convert key to bytes (invalid hex)") from e
-
+        key_bytes = self.key_bytes
         iv = key_bytes
-        cipher = AES.new(key_bytes, AES.MODE_CBC, iv)
 
         try:
-            decrypted = cipher.decrypt(encrypted_data)
+            if Cipher is not None:
+                decryptor = Cipher(algorithms.AES(key_bytes), modes.CBC(iv)).decryptor()
+                decrypted = decryptor.update(encrypted_data) + decryptor.finalize()
+            else:
+                decrypted = AES.new(key_bytes, AES.MODE_CBC, iv).decrypt(encrypted_data)
         except Exception as e:
             raise ValueError("AES decryption failed") from e
 
@@ -78,17 +105,16 @@ class CNL:
         Strips out null and backspace padding bytes, decodes to UTF-8, and
         splits on CRLF.
         """
-        raw_plain = self._aes_decrypt(self.crypted_blob, self.fixed_key_hex)
+        raw_plain = self._aes_decrypt(self.crypted_blob)
 
-        # Remove any 0x00 or 0x08 bytes
+        # Remove any 0x00 or 0x08 bytes in one pass, then split on CRLF and
+        # decode only the non-empty lines instead of the whole payload at once
         try:
-            cleaned = raw_plain.replace(b"\x00", b"").replace(b"\x08", b"")
-            text = cleaned.decode("utf-8")
+            cleaned = raw_plain.translate(None, delete=b"\x00\x08")
+            urls = [line.decode("utf-8") for line in cleaned.splitlines() if line.strip()]
         except Exception as e:
             raise ValueError("Failed to decode decrypted data to UTF-8") from e
 
-        # Split on CRLF, discard any empty lines
-        urls = [line for line in text.splitlines() if line.strip()]
         return urls
 
 
@@ -101,16 +127,12 @@ def decrypt_content(content_items: list[dict], mirror: str | None) -> list[str]:
     Returns a flat list of all decrypted URLs.
     """
     if mirror:
-        filtered = [item for item in content_items if mirror in item.get("hoster", "")]
+        filtered = [item for item in content_items if mirror in (item.get("hoster") or "")]
+        if not filtered:
+            info(f"No items found for mirror='{mirror}'. Falling back to all content_items.")
+            filtered = content_items
     else:
-        filtered = []
-
-    if mirror and not filtered:
-        info(f"No items found for mirror='{mirror}'. Falling back to all content_items.")
-        filtered = content_items.copy()
-
-    if not mirror:
-        filtered = content_items.copy()
+        filtered = content_items
 
     decrypted_links: list[str] = []
 
@@ -131,6 +153,11 @@ def decrypt_content(content_items: list[dict], mirror: str | None) -> list[str]:
             info(f"[Item {idx} | hoster={hoster_name}] Missing 'jk' or 'crypted' → skipping")
             continue
 
+        # Fail fast on blobs that could never decrypt, before paying for CNL setup
+        if len(crypted) % 4 or len(jnk) <= 16 or len(jnk) % 2:
+            info(f"[Item {idx} | hoster={hoster_name}] Malformed 'jk' or 'crypted' → skipping")
+            continue
+
         try:
             decryptor = CNL(item)
             urls = decryptor.decrypt()
@@ -144,19 +171,13 @@ def decrypt_content(content_items: list[dict], mirror: str | None) -> list[str]:
 
 
 def calculate_pixel_based_difference(img1, img2):
-    """Pillow-based absolute-difference % over all channels."""
+    """Absolute-difference % over all channels."""
     # ensure same mode and size
     diff = ImageChops.difference(img1, img2).convert("RGB")
-    w, h = diff.size
-    # histogram is [R0, R1, ..., R255, G0, ..., B255]
-    hist = diff.histogram()
-    zero_R = hist[0]
-    zero_G = hist[256]
-    zero_B = hist[512]
-    total_elements = w * h * 3
-    zero_elements = zero_R + zero_G + zero_B
-    non_zero = total_elements - zero_elements
-    return (non_zero * 100) / total_elements
+    # count differing values directly instead of building a 768-bin histogram
+    arr = np.asarray(diff)
+    non_zero = int(np.count_nonzero(arr))
+    return (non_zero * 100) / arr.size
 
 
 def solve_captcha(hostname, shared_state, fetch_via_flaresolverr, fetch_via_requests_session):
@@ -179,11 +200,16 @@ def solve_captcha(hostname, shared_state, fetch_via_flaresolverr, fetch_via_requ
     if not isinstance(image_ids, list) or len(image_ids) < 2:
         raise RuntimeError("Unexpected captcha IDs format.")
 
-    # Download each image
-    images = []
-    for img_id in image_ids:
+    # Download the images concurrently - they are independent and I/O-bound
+    def _download_image(img_id):
         img_url = f"{captcha_base}?cid=0&hash={img_id}"
-        r_img = fetch_via_requests_session(shared_state, method="GET", target_url=img_url, timeout=30)
+        return fetch_via_requests_session(shared_state, method="GET", target_url=img_url, timeout=30)
+
+    with ThreadPoolExecutor(max_workers=min(len(image_ids), 8)) as executor:
+        responses = list(executor.map(_download_image, image_ids))
+
+    images = []
+    for img_id, r_img in zip(image_ids, responses):
         if r_img.status_code != 200:
             raise RuntimeError(f"Failed to download captcha image {img_id} (HTTP {r_img.status_code})")
         elif not r_img.content:
@@ -192,16 +218,23 @@ def solve_captcha(hostname, shared_state, fetch_via_flaresolverr, fetch_via_requ
 
     # Convert to internal representation
     image_objects = []
+    white_bg = None  # captcha images share dimensions, so one white canvas serves them all
     for image_id, raw_bytes in images:
         img = Image.open(BytesIO(raw_bytes))
 
+        # The diff only needs relative differences, so downsample before any
+        # conversion - the pixel math then runs on a much smaller image.
+        img.thumbnail((64, 64), Image.Resampling.BILINEAR)
+
         # if it’s a palette (P) image with an indexed transparency, go through RGBA
         if img.mode == "P" and "transparency" in img.info:
             img = img.convert("RGBA")
 
         # if it has an alpha channel, composite it over white
         if img.mode == "RGBA":
-            background = Image.new("RGB", img.size, (255, 255, 255))
+            if white_bg is None or white_bg.size != img.size:
+                white_bg = Image.new("RGB", img.size, (255, 255, 255))
+            background = white_bg.copy()
             background.paste(img, mask=img.split()[3])
             img = background
         else:
@@ -211,13 +244,25 @@ def solve_captcha(hostname, shared_state, fetch_via_flaresolverr, fetch_via_requ
         image_objects.append((image_id, img))
 
     images_pixel_differences = []
-    for idx_i, (img_id_i, img_i) in enumerate(image_objects):
-        total_difference = 0.0
-        for idx_j, (img_id_j, img_j) in enumerate(image_objects):
-            if idx_i == idx_j:
-                continue  # skip self-comparison
-            total_difference += calculate_pixel_based_difference(img_i, img_j)
-        images_pixel_differences.append((img_id_i, total_difference))
+    if len({img.size for _, img in image_objects}) == 1:
+        # All images share dimensions: stack them into one (N, H, W, 3) tensor
+        # and compute every pairwise diff in a single vectorized pass instead
+        # of N² Pillow subtractions.
+        arr = np.stack([np.asarray(img) for _, img in image_objects])
+        pairwise_diffs = np.count_nonzero(arr[:, None] != arr[None, :], axis=(2, 3, 4))
+        values_per_image = arr.shape[1] * arr.shape[2] * arr.shape[3]
+        total_differences = pairwise_diffs.sum(axis=1) * 100.0 / values_per_image
+        images_pixel_differences = [(image_objects[idx][0], float(total_differences[idx]))
+                                    for idx in range(len(image_objects))]
+    else:
+        # Mismatched dimensions: fall back to per-pair Pillow comparison
+        for idx_i, (img_id_i, img_i) in enumerate(image_objects):
+            total_difference = 0.0
+            for idx_j, (img_id_j, img_j) in enumerate(image_objects):
+                if idx_i == idx_j:
+                    continue  # skip self-comparison
+                total_difference += calculate_pixel_based_difference(img_i, img_j)
+            images_pixel_differences.append((img_id_i, total_difference))
 
     identified_captcha_image, cumulated_percentage = max(images_pixel_differences, key=lambda x: x[1])
     different_pixels_percentage = int(cumulated_percentage / len(images)) if images else int(cumulated_percentage)
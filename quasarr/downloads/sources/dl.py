@@ -4,58 +4,88 @@
 
 import re
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from quasarr.providers.log import info, debug
 from quasarr.providers.sessions.dl import retrieve_and_validate_session, fetch_via_requests_session, invalidate_session
 
 hostname = "dl"
 
+# Posts are only mined for anchors, so skip building a DOM for everything else
+_ANCHORS_ONLY = SoupStrainer('a', href=True)
 
-def extract_links_from_post(post_html):
+# Common file hosters and link crypters, compiled once into a single alternation.
+# Link crypters/containers come first (these contain the actual links).
+_HOSTER_RE = re.compile(
+    r'(?:'
+    r'filecrypt\.cc|'
+    r'linksnappy\.io|'
+    r'relink\.us|'
+    r'links\.snahp\.it|'
+    # Direct file hosters
+    r'rapidgator\.net|'
+    r'uploaded\.net|'
+    r'nitroflare\.com|'
+    r'turbobit\.net|'
+    r'ddownload\.com|'
+    r'filefactory\.com|'
+    r'katfile\.com|'
+    r'mexashare\.com|'
+    r'keep2share\.cc|'
+    r'alfafile\.net|'
+    r'mega\.nz|'
+    r'1fichier\.com'
+    r')',
+    re.IGNORECASE
+)
+
+
+_PASSWORD_RE = re.compile(r'(?:Passwort|Password|Pass|PW)[\s:]*([^\s<]+)', re.IGNORECASE)
+
+
+def extract_password(text, default):
+    """
+    Find a release password near a "Passwort"/"Password" marker.
+    Searches a small window around the first marker before falling back to a
+    full-text scan, so large posts are not traversed twice.
+    """
+    idx = text.lower().find('passw')
+    if idx >= 0:
+        match = _PASSWORD_RE.search(text, max(0, idx - 20), idx + 200)
+        if match:
+            return match.group(1)
+    match = _PASSWORD_RE.search(text)
+    if match:
+        return match.group(1)
+    return default
+
+
+def extract_links_from_post(post_content):
     """
     Extract download links from a forum post.
+    Accepts either an HTML string or an already-parsed bs4 node, so callers
+    holding a parsed subtree don't pay for a serialize + re-parse round-trip.
     Common patterns: direct links, base64 encoded, obfuscated links
     """
     links = []
-    soup = BeautifulSoup(post_html, 'html.parser')
-    
+    seen = set()
+    if hasattr(post_content, 'find_all'):
+        soup = post_content
+    else:
+        soup = BeautifulSoup(post_content, 'lxml', parse_only=_ANCHORS_ONLY)
+
     # Find all links in the post
     for link in soup.find_all('a', href=True):
         href = link.get('href')
-        
+
         # Skip internal forum links
         if href.startswith('/') or 'data-load.me' in href:
             continue
-        
-        # Common file hosters and link crypters
-        hoster_patterns = [
-            # Link crypters/containers (PRIORITY - these contain the actual links)
-            r'filecrypt\.cc',
-            r'linksnappy\.io',
-            r'relink\.us',
-            r'links\.snahp\.it',
-            # Direct file hosters
-            r'rapidgator\.net',
-            r'uploaded\.net',
-            r'nitroflare\.com',
-            r'turbobit\.net',
-            r'ddownload\.com',
-            r'filefactory\.com',
-            r'katfile\.com',
-            r'mexashare\.com',
-            r'keep2share\.cc',
-            r'alfafile\.net',
-            r'mega\.nz',
-            r'1fichier\.com'
-        ]
-        
-        for pattern in hoster_patterns:
-            if re.search(pattern, href, re.IGNORECASE):
-                if href not in links:
-                    links.append(href)
-                break
-    
+
+        if _HOSTER_RE.search(href) and href not in seen:
+            seen.add(href)
+            links.append(href)
+
     return links
 
 
@@ -89,7 +119,9 @@ def get_dl_download_links(shared_state, url, mirror, title):
             info(f"Failed to load thread page: {url} (Status: {response.status_code})")
             return {}
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Parse the raw bytes so lxml's C-level charset detection handles the
+        # encoding instead of requests' Python-side sniffing
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Extract links from the first post (original post)
         first_post = soup.select_one('article.message--post')
@@ -103,25 +135,15 @@ def get_dl_download_links(shared_state, url, mirror, title):
             return {}
         
         # Extract all download links
-        links = extract_links_from_post(str(post_content))
+        links = extract_links_from_post(post_content)
         
         if not links:
             info(f"No download links found in thread: {url}")
             return {}
         
         # Extract password if present
-        password = f"www.{host}"
-        password_patterns = [
-            r'(?:Passwort|Password|Pass|PW)[\s:]*([^\s<]+)',
-            r'www\.data-load\.me'
-        ]
-        
         post_text = post_content.get_text()
-        for pattern in password_patterns:
-            match = re.search(pattern, post_text, re.IGNORECASE)
-            if match and len(match.groups()) > 0:
-                password = match.group(1)
-                break
+        password = extract_password(post_text, f"www.{host}")
         
         debug(f"Found {len(links)} download link(s) for: {title}")
         
@@ -4,11 +4,65 @@
 
 import re
 
-from bs4 import BeautifulSoup
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
 
 from quasarr.providers.log import info, debug
 
 hostname = "wcx"
+_HOST_U = hostname.upper()
+
+# Pooled session so detail-page and API calls reuse one TLS connection
+_session = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# Detail pages are only mined for anchors, so skip building a DOM for everything else
+_ANCHORS_ONLY = SoupStrainer('a', href=True)
+
+# Common link crypters and file hosters, compiled once into a single alternation.
+# Link crypters come first (priority).
+_HOSTER_RE = re.compile(
+    r'(?:'
+    r'filecrypt\.cc|'
+    r'linksnappy\.io|'
+    r'relink\.us|'
+    r'links\.snahp\.it|'
+    # Direct file hosters
+    r'rapidgator\.net|'
+    r'uploaded\.net|'
+    r'nitroflare\.com|'
+    r'ddownload\.com|'
+    r'filefactory\.com|'
+    r'katfile\.com|'
+    r'mexashare\.com|'
+    r'keep2share\.cc|'
+    r'mega\.nz|'
+    r'1fichier\.com'
+    r')',
+    re.IGNORECASE
+)
+
+
+_PASSWORD_RE = re.compile(r'(?:Passwort|Password|Pass|PW)[\s:]*([^\s<]+)', re.IGNORECASE)
+
+
+def extract_password(text, default):
+    """
+    Find a release password near a "Passwort"/"Password" marker.
+    Searches a small window around the first marker before falling back to a
+    full-text scan, so large documents are not traversed twice.
+    """
+    idx = text.lower().find('passw')
+    if idx >= 0:
+        match = _PASSWORD_RE.search(text, max(0, idx - 20), idx + 200)
+        if match:
+            return match.group(1)
+    match = _PASSWORD_RE.search(text)
+    if match:
+        return match.group(1)
+    return default
 
 
 def extract_links_from_page(page_html):
@@ -17,42 +71,21 @@ def extract_links_from_page(page_html):
     Looks for filecrypt.cc links and other link crypters.
     """
     links = []
-    soup = BeautifulSoup(page_html, 'html.parser')
-    
+    seen = set()
+    soup = BeautifulSoup(page_html, 'lxml', parse_only=_ANCHORS_ONLY)
+
     # Find all links
     for link in soup.find_all('a', href=True):
         href = link.get('href')
-        
+
         # Skip internal links
         if href.startswith('/') or 'warez.cx' in href:
             continue
-        
-        # Common link crypters and file hosters
-        patterns = [
-            # Link crypters (priority)
-            r'filecrypt\.cc',
-            r'linksnappy\.io',
-            r'relink\.us',
-            r'links\.snahp\.it',
-            # Direct file hosters
-            r'rapidgator\.net',
-            r'uploaded\.net',
-            r'nitroflare\.com',
-            r'ddownload\.com',
-            r'filefactory\.com',
-            r'katfile\.com',
-            r'mexashare\.com',
-            r'keep2share\.cc',
-            r'mega\.nz',
-            r'1fichier\.com'
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, href, re.IGNORECASE):
-                if href not in links:
-                    links.append(href)
-                break
-    
+
+        if _HOSTER_RE.search(href) and href not in seen:
+            seen.add(href)
+            links.append(href)
+
     return links
 
 
@@ -73,9 +106,7 @@ def get_wcx_download_links(shared_state, url, mirror, title):
         dict with 'links', 'password', and 'title'
     """
     wcx = shared_state.values["config"]("Hostnames").get(hostname.lower())
-    
-    import requests
-    
+
     headers = {
         'User-Agent': shared_state.values["user_agent"],
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
@@ -83,10 +114,10 @@ def get_wcx_download_links(shared_state, url, mirror, title):
 
     try:
         # Try to fetch the detail page
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _session.get(url, headers=headers, timeout=10)
         
         if response.status_code != 200:
-            info(f"{hostname.upper()}: Failed to load page: {url} (Status: {response.status_code})")
+            info(f"{_HOST_U}: Failed to load page: {url} (Status: {response.status_code})")
             return {}
         
         # warez.cx uses client-side rendering with Vue.js
@@ -102,8 +133,8 @@ def get_wcx_download_links(shared_state, url, mirror, title):
             # Try to fetch via API
             api_url = f'https://api.{wcx}/release/{slug}'
             try:
-                api_response = requests.get(api_url, headers={'User-Agent': shared_state.values["user_agent"]}, 
-                                           timeout=10)
+                api_response = _session.get(api_url, headers={'User-Agent': shared_state.values["user_agent"]},
+                                            timeout=10)
                 if api_response.status_code == 200:
                     data = api_response.json()
                     
@@ -122,7 +153,7 @@ def get_wcx_download_links(shared_state, url, mirror, title):
                     
                     if links:
                         password = f"www.{wcx}"
-                        debug(f"{hostname.upper()}: Found {len(links)} download link(s) via API for: {title}")
+                        debug(f"{_HOST_U}: Found {len(links)} download link(s) via API for: {title}")
                         
                         return {
                             "links": links,
@@ -133,27 +164,18 @@ def get_wcx_download_links(shared_state, url, mirror, title):
                 # API failed, fall back to HTML parsing
                 pass
         
-        # Fall back to HTML parsing
-        links = extract_links_from_page(response.text)
-        
+        # Fall back to HTML parsing; passing the raw bytes lets lxml's
+        # C-level charset detection handle the encoding
+        links = extract_links_from_page(response.content)
+
         if not links:
-            info(f"{hostname.upper()}: No download links found on page: {url}")
+            info(f"{_HOST_U}: No download links found on page: {url}")
             return {}
+
+        # Extract password (needs the decoded text for the string search)
+        password = extract_password(response.text, f"www.{wcx}")
         
-        # Extract password
-        password = f"www.{wcx}"
-        password_patterns = [
-            r'(?:Passwort|Password|Pass|PW)[\s:]*([^\s<]+)',
-            r'www\.warez\.cx'
-        ]
-        
-        for pattern in password_patterns:
-            match = re.search(pattern, response.text, re.IGNORECASE)
-            if match and len(match.groups()) > 0:
-                password = match.group(1)
-                break
-        
-        debug(f"{hostname.upper()}: Found {len(links)} download link(s) for: {title}")
+        debug(f"{_HOST_U}: Found {len(links)} download link(s) for: {title}")
         
         return {
             "links": links,
@@ -162,5 +184,5 @@ def get_wcx_download_links(shared_state, url, mirror, title):
         }
         
     except Exception as e:
-        info(f"{hostname.upper()}: Error extracting download links from {url}: {e}")
+        info(f"{_HOST_U}: Error extracting download links from {url}: {e}")
         return {}
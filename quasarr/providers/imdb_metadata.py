@@ -4,7 +4,9 @@
 
 import html
 import re
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from json import loads
 from urllib.parse import quote
 
@@ -13,19 +15,27 @@ from bs4 import BeautifulSoup
 
 from quasarr.providers.log import info, debug
 
+# Pooled session so repeated IMDb lookups reuse one TLS connection instead of
+# paying a fresh TCP+TLS handshake per call.
+_session = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# IMDb embeds the poster in the JSON-LD block, so a narrow regex pull avoids
+# building a DOM for a page that is hundreds of KB.
+_POSTER_RE = re.compile(r'"image"\s*:\s*"(https://m\.media-amazon\.com/images/[^"]+)"')
+
 
 def get_poster_link(shared_state, imdb_id):
     poster_link = None
     if imdb_id:
         headers = {'User-Agent': shared_state.values["user_agent"]}
-        request = requests.get(f"https://www.imdb.com/title/{imdb_id}/", headers=headers, timeout=10).text
-        soup = BeautifulSoup(request, "html.parser")
+        request = _session.get(f"https://www.imdb.com/title/{imdb_id}/", headers=headers, timeout=10).text
         try:
-            poster_set = soup.find('div', class_='ipc-poster').div.img[
-                "srcset"]  # contains links to posters in ascending resolution
-            poster_links = [x for x in poster_set.split(" ") if
-                            len(x) > 10]  # extract all poster links ignoring resolution info
-            poster_link = poster_links[-1]  # get the highest resolution poster
+            match = _POSTER_RE.search(request)
+            if match:
+                poster_link = match.group(1)
         except:
             pass
 
@@ -44,7 +54,7 @@ def get_localized_title(shared_state, imdb_id, language='de'):
     }
 
     try:
-        response = requests.get(f"https://www.imdb.com/title/{imdb_id}/", headers=headers, timeout=10)
+        response = _session.get(f"https://www.imdb.com/title/{imdb_id}/", headers=headers, timeout=10)
     except Exception as e:
         info(f"Error loading IMDb metadata for {imdb_id}: {e}")
         return localized_title
@@ -70,6 +80,34 @@ def get_localized_title(shared_state, imdb_id, language='de'):
     return localized_title
 
 
+class _LookupFailed(Exception):
+    """Raised internally so failed lookups are not cached."""
+    pass
+
+
+@lru_cache(maxsize=1024)
+def _localized_title_cached(shared_state, imdb_id, language, _hour):
+    title = get_localized_title(shared_state, imdb_id, language)
+    if not title:
+        raise _LookupFailed
+    return title
+
+
+def get_cached_localized_title(shared_state, imdb_id, language='de'):
+    """
+    Cached variant of get_localized_title for the search hot path.
+
+    Sonarr/Radarr poll every configured hostname with the same IMDb ID, so
+    without a cache each tick pays one identical IMDb request per hostname.
+    The hour bucket in the cache key acts as a TTL so renamed titles are
+    picked up eventually; failed lookups are never cached.
+    """
+    try:
+        return _localized_title_cached(shared_state, imdb_id, language, int(time.time() // 3600))
+    except _LookupFailed:
+        return None
+
+
 def get_clean_title(title):
     try:
         extracted_title = re.findall(r"(.*?)(?:.(?!19|20)\d{2}|\.German|.GERMAN|\.\d{3,4}p|\.S(?:\d{1,3}))", title)[0]
@@ -106,11 +144,11 @@ def get_imdb_id_from_title(shared_state, title, language="de"):
         'User-Agent': shared_state.values["user_agent"]
     }
 
-    results = requests.get(f"https://www.imdb.com/find/?q={quote(title)}&s=tt&ttype={ttype}&ref_=fn_{ttype}",
+    results = _session.get(f"https://www.imdb.com/find/?q={quote(title)}&s=tt&ttype={ttype}&ref_=fn_{ttype}",
                            headers=headers, timeout=10)
 
     if results.status_code == 200:
-        soup = BeautifulSoup(results.text, "html.parser")
+        soup = BeautifulSoup(results.text, "lxml")
         props = soup.find("script", text=re.compile("props"))
         details = loads(props.string)
         search_results = details['props']['pageProps']['titleResults']['results']
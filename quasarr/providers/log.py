@@ -17,3 +17,8 @@ def info(string):
 def debug(string):
     if os.getenv('DEBUG'):
         info(string)
+
+
+def debug_enabled():
+    """Allows callers to skip building debug strings that would be discarded."""
+    return bool(os.getenv('DEBUG'))
@@ -2,8 +2,7 @@
 # Quasarr
 # Project by https://github.com/rix1337
 
-import base64
-import pickle
+import json
 
 import requests
 
@@ -11,6 +10,52 @@ from quasarr.providers.log import info, debug
 
 hostname = "dl"
 
+# Per-process cache of the deserialized session, keyed by the DB token it was
+# loaded from, so repeated HTTP calls don't unpickle a fresh Session each time.
+_session_cache = {"session": None, "token": None}
+
+
+def _cookie_snapshot(jar):
+    """
+    Snapshot the jar under its lock. CookieJar iteration itself takes no lock,
+    so a Set-Cookie processed on another thread mid-iteration would raise
+    RuntimeError - the cached session is shared by concurrent page fetches.
+    """
+    with jar._cookies_lock:
+        return tuple(sorted((c.name, c.value, c.domain) for c in jar))
+
+
+def _serialize_session(sess):
+    """
+    Serialize the session state that actually matters (cookies + user agent)
+    into a compact JSON string. Far cheaper than pickling a whole Session and
+    not tied to the Python version.
+    """
+    with sess.cookies._cookies_lock:
+        cookies = [
+            {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path, "expires": c.expires}
+            for c in sess.cookies
+        ]
+    return json.dumps({"cookies": cookies, "user_agent": sess.headers.get("User-Agent")})
+
+
+def _deserialize_session(token):
+    """
+    Rebuild a fresh requests.Session from the JSON produced by _serialize_session.
+    Raises on malformed/legacy tokens so callers can fall back to a new login.
+    """
+    state = json.loads(token)
+    sess = requests.Session()
+    ua = state.get("user_agent")
+    if ua:
+        sess.headers.update({'User-Agent': ua})
+    for cookie in state.get("cookies", []):
+        sess.cookies.set(cookie["name"], cookie["value"],
+                         domain=cookie.get("domain") or "",
+                         path=cookie.get("path") or "/",
+                         expires=cookie.get("expires"))
+    return sess
+
 
 def create_and_persist_session(shared_state):
     """
@@ -58,10 +103,11 @@ def create_and_persist_session(shared_state):
         return None
 
     # Persist session to database
-    blob = pickle.dumps(sess)
-    token = base64.b64encode(blob).decode("utf-8")
+    token = _serialize_session(sess)
     shared_state.values["database"]("sessions").update_store(hostname, token)
-    
+    _session_cache["session"] = sess
+    _session_cache["token"] = token
+
     return sess
 
 
@@ -80,15 +126,17 @@ def retrieve_and_validate_session(shared_state):
     if not token:
         return create_and_persist_session(shared_state)
 
+    if token == _session_cache["token"] and _session_cache["session"] is not None:
+        return _session_cache["session"]
+
     try:
-        blob = base64.b64decode(token.encode("utf-8"))
-        sess = pickle.loads(blob)
-        if not isinstance(sess, requests.Session):
-            raise ValueError("Not a Session")
+        sess = _deserialize_session(token)
     except Exception as e:
         debug(f"{hostname}: session load failed: {e}")
         return create_and_persist_session(shared_state)
 
+    _session_cache["session"] = sess
+    _session_cache["token"] = token
     return sess
 
 
@@ -101,6 +149,8 @@ def invalidate_session(shared_state):
     """
     db = shared_state.values["database"]("sessions")
     db.delete(hostname)
+    _session_cache["session"] = None
+    _session_cache["token"] = None
     debug(f'Session for "{hostname}" marked as invalid!')
 
 
@@ -112,9 +162,11 @@ def _persist_session_to_db(shared_state, sess):
         shared_state: Shared state object
         sess: requests.Session to persist
     """
-    blob = pickle.dumps(sess)
-    token = base64.b64encode(blob).decode("utf-8")
-    shared_state.values["database"]("sessions").update_store(hostname, token)
+    token = _serialize_session(sess)
+    if token != _session_cache["token"]:
+        shared_state.values["database"]("sessions").update_store(hostname, token)
+    _session_cache["session"] = sess
+    _session_cache["token"] = token
 
 
 def fetch_via_requests_session(shared_state, method: str, target_url: str, post_data: dict = None, get_params: dict = None, timeout: int = 30):
@@ -136,13 +188,17 @@ def fetch_via_requests_session(shared_state, method: str, target_url: str, post_
     if not sess:
         raise Exception(f"Could not retrieve valid session for {hostname}")
 
+    cookies_before = _cookie_snapshot(sess.cookies)
+
     # Execute request
     if method.upper() == "GET":
         resp = sess.get(target_url, params=get_params, timeout=timeout)
     else:  # POST
         resp = sess.post(target_url, data=post_data, timeout=timeout)
 
-    # Re-persist cookies, since the site might have modified them during the request
-    _persist_session_to_db(shared_state, sess)
+    # Re-persist cookies only if the site actually modified them during the request
+    cookies_after = _cookie_snapshot(sess.cookies)
+    if cookies_before != cookies_after:
+        _persist_session_to_db(shared_state, sess)
 
     return resp
@@ -5,38 +5,63 @@
 import re
 import time
 from base64 import urlsafe_b64encode
+from concurrent.futures import ThreadPoolExecutor
 from html import unescape
-from urllib.parse import quote_plus, urlencode
+from io import BytesIO
 
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
-from quasarr.providers.imdb_metadata import get_localized_title
+from quasarr.providers.imdb_metadata import get_cached_localized_title
 from quasarr.providers.log import info, debug
 from quasarr.providers.sessions.dl import retrieve_and_validate_session, invalidate_session, fetch_via_requests_session
 
 hostname = "dl"
 supported_mirrors = []  # data-load.me doesn't use mirrors
 
+# XPath selectors for the search result markup, compiled once at import so the
+# per-page parse skips bs4's CSS-to-XPath translation entirely
+_SEL_ROWS = etree.XPath("//li[contains(concat(' ', normalize-space(@class), ' '), ' block-row ')]")
+_SEL_TITLE_A = etree.XPath(".//h3[contains(@class, 'contentRow-title')]/a")
+_SEL_DATE = etree.XPath(".//div[contains(@class, 'contentRow-minor')]//time[contains(@class, 'u-dt')]/@datetime")
+
+
+def _make_payload(title, url, mirror, size, password, imdb_id):
+    """
+    Encode the 6-field download payload (title|url|mirror|size|password|imdb_id)
+    expected by the API. Joining pre-encoded bytes skips the intermediate str
+    an f-string would allocate; mirror goes through str() so None round-trips
+    as "None" like before.
+    """
+    return urlsafe_b64encode(b'|'.join((
+        title.encode('utf-8'),
+        url.encode('utf-8'),
+        str(mirror).encode('utf-8'),
+        str(size).encode('utf-8'),
+        password.encode('utf-8'),
+        (imdb_id or '').encode('utf-8')
+    ))).decode('ascii')
+
 
 def normalize_title_for_sonarr(title):
     """
     Normalize title for Sonarr by replacing spaces with dots.
     This is done AFTER we get the properly formatted title from data-load.me.
+    Runs once per RSS item / search result, so it sticks to C-level string
+    builtins instead of regex passes.
     """
-    # Replace spaces with dots
-    title = title.replace(' ', '.')
-    
-    # Fix group separator: " - " or ".-." -> "-"
-    title = re.sub(r'\s*-\s*', '-', title)
-    title = re.sub(r'\.\-\.', '-', title)
-    
+    # Replace whitespace runs with single dots
+    title = '.'.join(title.split())
+
+    # Fix group separator: ".-." (was " - ") -> "-"
+    title = title.replace('.-.', '-')
+
     # Remove multiple consecutive dots
-    title = re.sub(r'\.{2,}', '.', title)
-    
+    while '..' in title:
+        title = title.replace('..', '.')
+
     # Remove leading/trailing dots
-    title = title.strip('.')
-    
-    return title
+    return title.strip('.')
 
 
 def dl_feed(shared_state, start_time, request_from, mirror=None):
@@ -73,49 +98,40 @@ def dl_feed(shared_state, start_time, request_from, mirror=None):
             info(f"{hostname}: RSS feed returned status {response.status_code}")
             return releases
         
-        # Parse RSS feed with BeautifulSoup (XML parser)
-        soup = BeautifulSoup(response.content, 'xml')
-        
-        # Find all items in the RSS feed
-        items = soup.find_all('item')
-        
-        if not items:
-            debug(f"{hostname}: No entries found in RSS feed")
-            return releases
-        
-        for item in items:
+        # Constant for every item in this feed pass
+        download_prefix = f"{shared_state.values['internal_address']}/download/?payload="
+
+        # Stream-parse the RSS feed: iterparse emits each <item> as soon as it
+        # is closed and elem.clear() keeps memory flat, so no tree is built for
+        # the rest of the document
+        items_found = False
+        context = etree.iterparse(BytesIO(response.content), events=('end',), tag='item', recover=True)
+
+        for _, item in context:
+            items_found = True
             try:
                 # Get title
-                title_tag = item.find('title')
-                if not title_tag:
-                    continue
-                    
-                title = title_tag.get_text(strip=True)
+                title = (item.findtext('title') or '').strip()
                 if not title:
                     continue
-                
-                # Clean up title - remove HTML entities and CDATA
-                title = unescape(title)
-                title = title.replace(']]>', '').replace('<![CDATA[', '')
-                
+
+                # iterparse already resolves entities and unwraps CDATA, so the
+                # cleanup only runs for the rare feed that double-encodes
+                if ']]>' in title or '&' in title:
+                    title = unescape(title)
+                    title = title.replace(']]>', '').replace('<![CDATA[', '')
+
                 # Normalize for Sonarr (spaces -> dots)
                 title = normalize_title_for_sonarr(title)
-                
+
                 # Get thread URL
-                link_tag = item.find('link')
-                if not link_tag:
-                    continue
-                    
-                thread_url = link_tag.get_text(strip=True)
+                thread_url = (item.findtext('link') or '').strip()
                 if not thread_url:
                     continue
-                
+
                 # Get publication date
-                date_str = ""
-                pub_date = item.find('pubDate')
-                if pub_date:
-                    date_str = pub_date.get_text(strip=True)
-                
+                date_str = (item.findtext('pubDate') or '').strip()
+
                 # Size is typically not available in RSS feed
                 mb = 0
                 imdb_id = None
@@ -123,12 +139,8 @@ def dl_feed(shared_state, start_time, request_from, mirror=None):
                 # data-load.me doesn't require a password, but we need the field for payload compatibility
                 password = ""
                 
-                # Create payload with 6 elements to match API expectations:
-                # title|url|mirror|size|password|imdb_id
-                payload = urlsafe_b64encode(
-                    f"{title}|{thread_url}|{mirror}|{mb}|{password}|{imdb_id or ''}".encode("utf-8")
-                ).decode("utf-8")
-                link = f"{shared_state.values['internal_address']}/download/?payload={payload}"
+                payload = _make_payload(title, thread_url, mirror, mb, password, imdb_id)
+                link = download_prefix + payload
                 
                 releases.append({
                     "details": {
@@ -143,11 +155,16 @@ def dl_feed(shared_state, start_time, request_from, mirror=None):
                     },
                     "type": "protected"
                 })
-                
+
             except Exception as e:
                 debug(f"{hostname}: error parsing RSS entry: {e}")
-                continue
-        
+            finally:
+                item.clear()
+
+        if not items_found:
+            debug(f"{hostname}: No entries found in RSS feed")
+            return releases
+
     except Exception as e:
         info(f"{hostname}: RSS feed error: {e}")
         invalidate_session(shared_state)
@@ -174,7 +191,7 @@ def dl_search(shared_state, start_time, request_from, search_string,
     # Handle IMDb ID
     imdb_id = shared_state.is_imdb_id(search_string)
     if imdb_id:
-        title = get_localized_title(shared_state, imdb_id, 'de')
+        title = get_cached_localized_title(shared_state, imdb_id, 'de')
         if not title:
             info(f"{hostname}: no title for IMDb {imdb_id}")
             return releases
@@ -201,58 +218,82 @@ def dl_search(shared_state, start_time, request_from, search_string,
 
         # Paginate through search results
         search_id = None  # Will be extracted from first search response
-        
-        for page_num in range(1, max_pages + 1):
-            info(f"{hostname}: [Page {page_num}/{max_pages}] Searching...")
-
-            if page_num == 1:
-                # FIRST SEARCH: Use /search/search endpoint to get search ID
-                search_params = {
-                    'keywords': search_string,
-                    'c[title_only]': 1  # Title-only search
-                }
-                search_url = f'https://www.{host}/search/search'
+        page_responses = []
+
+        # FIRST SEARCH: Use /search/search endpoint to get search ID
+        info(f"{hostname}: [Page 1/{max_pages}] Searching...")
+        search_params = {
+            'keywords': search_string,
+            'c[title_only]': 1  # Title-only search
+        }
+        first_response = fetch_via_requests_session(shared_state, method="GET",
+                                                    target_url=f'https://www.{host}/search/search',
+                                                    get_params=search_params,
+                                                    timeout=10)
+        page_responses.append((1, first_response))
+
+        if first_response.status_code == 200:
+            # EXTRACT SEARCH ID from first page response URL
+            # URL format: https://www.data-load.me/search/42213917/?q=gangs+of+london&o=relevance
+            match = re.search(r'/search/(\d+)/', first_response.url)
+            if match:
+                search_id = match.group(1)
+                info(f"{hostname}: [Page 1] Extracted search ID: {search_id}")
             else:
-                # PAGINATION: Use the search ID from first page
-                if not search_id:
-                    info(f"{hostname}: No search ID found, stopping pagination")
-                    break
-                
-                search_params = {
-                    'page': page_num,
-                    'q': search_string,
-                    'o': 'relevance'
-                }
-                # Use the search ID URL: /search/{search_id}/
-                search_url = f'https://www.{host}/search/{search_id}/'
-            
-            # Execute search with GET
-            search_response = fetch_via_requests_session(shared_state, method="GET",
-                                                         target_url=search_url,
-                                                         get_params=search_params,
-                                                         timeout=10)
+                info(f"{hostname}: [Page 1] Could not extract search ID from URL: {first_response.url}")
+
+            if search_id and max_pages > 1:
+                # PAGINATION: pages 2..max_pages only depend on the search ID,
+                # so fetch them concurrently via the search ID URL: /search/{search_id}/
+                # URL and base params are identical for every page; only the
+                # page number varies
+                paginated_url = f'https://www.{host}/search/{search_id}/'
+                base_params = {'q': search_string, 'o': 'relevance'}
+
+                def _fetch_page(fetch_page_num):
+                    info(f"{hostname}: [Page {fetch_page_num}/{max_pages}] Searching...")
+                    try:
+                        return fetch_via_requests_session(shared_state, method="GET",
+                                                          target_url=paginated_url,
+                                                          get_params={**base_params, 'page': fetch_page_num},
+                                                          timeout=10)
+                    except Exception as e:
+                        # A failed page must not discard the pages that worked;
+                        # the ordered parse loop treats None as a failed page
+                        info(f"{hostname}: [Page {fetch_page_num}] fetch failed: {e}")
+                        return None
+
+                remaining_pages = range(2, max_pages + 1)
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    page_responses.extend(zip(remaining_pages, executor.map(_fetch_page, remaining_pages)))
+            elif not search_id:
+                info(f"{hostname}: No search ID found, stopping pagination")
+
+        # Constant for every release produced by this search; local bindings
+        # avoid re-resolving the shared_state attribute chain per item
+        download_prefix = f"{shared_state.values['internal_address']}/download/?payload="
+        is_valid_release = shared_state.is_valid_release
+
+        # Paginated results can overlap between pages; threads already seen
+        # are skipped before paying for title cleanup and validation again
+        seen_urls = set()
+
+        # Parse the responses in page order so the "stop on first empty/failed
+        # page" semantics are preserved
+        for page_num, search_response in page_responses:
+            if search_response is None:
+                info(f"{hostname}: [Page {page_num}] fetch failed, stopping pagination")
+                break  # Stop if page fails
 
             if search_response.status_code != 200:
                 info(f"{hostname}: [Page {page_num}] returned status {search_response.status_code}, stopping pagination")
                 break  # Stop if page fails
-            
-            # EXTRACT SEARCH ID from first page response URL
-            # URL format: https://www.data-load.me/search/42213917/?q=gangs+of+london&o=relevance
-            if page_num == 1 and not search_id:
-                import re
-                # Extract search ID from URL
-                match = re.search(r'/search/(\d+)/', search_response.url)
-                if match:
-                    search_id = match.group(1)
-                    info(f"{hostname}: [Page 1] Extracted search ID: {search_id}")
-                else:
-                    info(f"{hostname}: [Page 1] Could not extract search ID from URL: {search_response.url}")
-
-            soup = BeautifulSoup(search_response.text, 'html.parser')
-            
+
+            tree = lxml_html.fromstring(search_response.content)
+
             # Parse search results
-            result_items = soup.select('li.block-row')
-            
+            result_items = _SEL_ROWS(tree)
+
             if not result_items:
                 info(f"{hostname}: [Page {page_num}] found 0 results, stopping pagination")
                 break  # No more results
@@ -267,33 +308,43 @@ def dl_search(shared_state, start_time, request_from, search_string,
                     total_processed += 1
                     
                     # Get title and link
-                    title_elem = item.select_one('h3.contentRow-title a')
-                    if not title_elem:
+                    title_links = _SEL_TITLE_A(item)
+                    if not title_links:
                         page_skipped += 1
                         total_skipped += 1
                         continue
-                    
+                    title_elem = title_links[0]
+
+                    thread_url = title_elem.get('href')
+                    if thread_url.startswith('/'):
+                        thread_url = f"https://www.{host}{thread_url}"
+                    if thread_url in seen_urls:
+                        page_skipped += 1
+                        total_skipped += 1
+                        continue
+                    seen_urls.add(thread_url)
+
                     # Get the raw title from data-load.me
-                    # CRITICAL: Use separator=' ' to preserve spaces when removing highlight tags!
+                    # CRITICAL: Join the text fragments with spaces so removing
+                    # highlight tags keeps word boundaries intact!
                     # <em>Gangs</em> <em>of</em> <em>London</em> -> "Gangs of London"
-                    title = title_elem.get_text(separator=' ', strip=True)
-                    
+                    title = ' '.join(title_elem.itertext())
+
                     # Clean up multiple spaces that might result from tag removal
-                    title = re.sub(r'\s+', ' ', title)
-                    
-                    # Basic HTML entity cleanup
-                    title = unescape(title)
+                    title = ' '.join(title.split())
+
+                    # lxml resolves entities during parsing; only double-encoded
+                    # titles still carry raw ampersands here
+                    if '&' in title:
+                        title = unescape(title)
                     
                     # Normalize for Sonarr (spaces -> dots)
                     # "My Hero Academia S01" -> "My.Hero.Academia.S01"
                     title_normalized = normalize_title_for_sonarr(title)
-                    
-                    thread_url = title_elem.get('href')
-                    if thread_url.startswith('/'):
-                        thread_url = f"https://www.{host}{thread_url}"
-                    
-                    # Validate release with normalized title
-                    if not shared_state.is_valid_release(title_normalized, request_from, search_string, season, episode):
+
+                    # Validate release with normalized title before any further
+                    # per-item work - rejected items pay nothing beyond the title
+                    if not is_valid_release(title_normalized, request_from, search_string, season, episode):
                         page_skipped += 1
                         total_skipped += 1
                         continue
@@ -303,13 +354,8 @@ def dl_search(shared_state, start_time, request_from, search_string,
                     total_valid += 1
 
                     # Get metadata
-                    date_str = ""
-                    minor_info = item.select_one('div.contentRow-minor')
-                    if minor_info:
-                        # Extract date
-                        date_elem = minor_info.select_one('time.u-dt')
-                        if date_elem:
-                            date_str = date_elem.get('datetime', '')
+                    dates = _SEL_DATE(item)
+                    date_str = dates[0] if dates else ""
                     
                     # Size is typically not available in search results, set to 0
                     mb = 0
@@ -317,12 +363,8 @@ def dl_search(shared_state, start_time, request_from, search_string,
                     # data-load.me doesn't require a password, but we need the field for payload compatibility
                     password = ""
                     
-                    # Create payload with 6 elements to match API expectations:
-                    # title|url|mirror|size|password|imdb_id
-                    payload = urlsafe_b64encode(
-                        f"{title_normalized}|{thread_url}|{mirror}|{mb}|{password}|{imdb_id or ''}".encode("utf-8")
-                    ).decode("utf-8")
-                    link = f"{shared_state.values['internal_address']}/download/?payload={payload}"
+                    payload = _make_payload(title_normalized, thread_url, mirror, mb, password, imdb_id)
+                    link = download_prefix + payload
                     
                     releases.append({
                         "details": {
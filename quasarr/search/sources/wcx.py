@@ -4,16 +4,48 @@
 
 import html
 import time
+import traceback
 from base64 import urlsafe_b64encode
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 
 import requests
+from lxml import etree
 
-from quasarr.providers.imdb_metadata import get_localized_title
-from quasarr.providers.log import info, debug
+from quasarr.providers.imdb_metadata import get_cached_localized_title
+from quasarr.providers.log import info, debug, debug_enabled
 
 hostname = "wcx"
+_HOST_U = hostname.upper()  # computed once; the log prefix appears in every message
 supported_mirrors = []  # warez.cx uses link crypters, not specific mirrors
 
+# Pooled session so the RSS, search and per-UID detail calls reuse one TLS
+# connection instead of handshaking for every request
+_session = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# The feed is either plain RSS (<item>) or Atom (<entry>, namespaced)
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+
+def _make_payload(title, url, mirror, size, password, imdb_id):
+    """
+    Encode the 6-field download payload (title|url|mirror|size|password|imdb_id)
+    expected by the API. Joining pre-encoded bytes skips the intermediate str
+    an f-string would allocate; mirror goes through str() so None round-trips
+    as "None" like before.
+    """
+    return urlsafe_b64encode(b'|'.join((
+        title.encode('utf-8'),
+        url.encode('utf-8'),
+        str(mirror).encode('utf-8'),
+        str(size).encode('utf-8'),
+        password.encode('utf-8'),
+        (imdb_id or '').encode('utf-8')
+    ))).decode('ascii')
+
 
 def wcx_feed(shared_state, start_time, request_from, mirror=None):
     """
@@ -23,7 +55,7 @@ def wcx_feed(shared_state, start_time, request_from, mirror=None):
     wcx = shared_state.values["config"]("Hostnames").get(hostname.lower())
 
     if "lazylibrarian" in request_from.lower():
-        debug(f'Skipping {request_from} search on "{hostname.upper()}" (unsupported media type)!')
+        debug(f'Skipping {request_from} search on "{_HOST_U}" (unsupported media type)!')
         return releases
 
     rss_url = f'https://{wcx}/rss'
@@ -32,68 +64,61 @@ def wcx_feed(shared_state, start_time, request_from, mirror=None):
     }
 
     try:
-        from bs4 import BeautifulSoup
-        response = requests.get(rss_url, headers=headers, timeout=10)
-        
+        response = _session.get(rss_url, headers=headers, timeout=10)
+
         if response.status_code != 200:
-            info(f"{hostname.upper()}: RSS feed returned status {response.status_code}")
+            info(f"{_HOST_U}: RSS feed returned status {response.status_code}")
             return releases
-        
-        soup = BeautifulSoup(response.content, 'xml')
-        items = soup.find_all('entry')
-        
-        if not items:
-            items = soup.find_all('item')
-        
-        if not items:
-            debug(f"{hostname.upper()}: No entries found in RSS feed")
-            return releases
-        
+
+        # Constant for every entry in this feed pass
+        download_prefix = f"{shared_state.values['internal_address']}/download/?payload="
+
+        # Stream-parse the feed: iterparse emits each entry as soon as it is
+        # closed and elem.clear() keeps memory flat even at 300 entries
         max_releases = 300
-        if len(items) > max_releases:
-            info(f"{hostname.upper()}: Found {len(items)} entries, limiting to {max_releases}")
-            items = items[:max_releases]
-        else:
-            info(f"{hostname.upper()}: Found {len(items)} entries in RSS feed")
-        
-        for item in items:
+        entries_seen = 0
+        debug_active = debug_enabled()
+        context = etree.iterparse(BytesIO(response.content), events=('end',),
+                                  tag=('item', f'{_ATOM_NS}entry'), recover=True)
+
+        for _, item in context:
+            entries_seen += 1
+            if entries_seen > max_releases:
+                info(f"{_HOST_U}: Found more than {max_releases} entries, limiting to {max_releases}")
+                break
             try:
-                title_tag = item.find('title')
-                if not title_tag:
-                    continue
-                    
-                title = title_tag.get_text(strip=True)
+                title = (item.findtext('title') or item.findtext(f'{_ATOM_NS}title') or '').strip()
                 if not title:
                     continue
-                
-                title = html.unescape(title)
-                title = title.replace(']]>', '').replace('<![CDATA[', '')
+
+                # iterparse already resolves entities and unwraps CDATA, so the
+                # cleanup only runs for the rare feed that double-encodes
+                if ']]>' in title or '&' in title:
+                    title = html.unescape(title)
+                    title = title.replace(']]>', '').replace('<![CDATA[', '')
                 title = title.replace(' ', '.')
-                
-                link_tag = item.find('link', rel='alternate')
-                if link_tag and link_tag.has_attr('href'):
-                    source = link_tag['href']
+
+                link_tag = item.find(f'{_ATOM_NS}link[@rel="alternate"]')
+                if link_tag is None:
+                    link_tag = item.find(f'{_ATOM_NS}link')
+                if link_tag is not None:
+                    source = link_tag.get('href') or ''
                 else:
-                    link_tag = item.find('link')
-                    if not link_tag:
-                        continue
-                    source = link_tag.get_text(strip=True)
-                
+                    source = (item.findtext('link') or '').strip()
+
                 if not source:
                     continue
-                
-                pub_date = item.find('updated') or item.find('pubDate')
-                published = pub_date.get_text(strip=True) if pub_date else ''
-                
+
+                published = (item.findtext(f'{_ATOM_NS}updated') or item.findtext('updated')
+                             or item.findtext('pubDate') or '').strip()
+
                 mb = 0
                 size = 0
                 imdb_id = None
                 password = f"www.{wcx}"
                 
-                payload = urlsafe_b64encode(
-                    f"{title}|{source}|{mirror}|{mb}|{password}|{imdb_id or ''}".encode("utf-8")
-                ).decode("utf-8")
-                link = f"{shared_state.values['internal_address']}/download/?payload={payload}"
+                payload = _make_payload(title, source, mirror, mb, password, imdb_id)
+                link = download_prefix + payload
                 
                 releases.append({
                     "details": {
@@ -108,13 +133,21 @@ def wcx_feed(shared_state, start_time, request_from, mirror=None):
                     },
                     "type": "protected"
                 })
-                
+
             except Exception as e:
-                debug(f"{hostname.upper()}: error parsing RSS entry: {e}")
-                continue
-        
+                if debug_active:
+                    debug(f"{_HOST_U}: error parsing RSS entry: {e}")
+            finally:
+                item.clear()
+
+        if not entries_seen:
+            debug(f"{_HOST_U}: No entries found in RSS feed")
+            return releases
+        if entries_seen <= max_releases:
+            info(f"{_HOST_U}: Found {entries_seen} entries in RSS feed")
+
     except Exception as e:
-        info(f"Error loading {hostname.upper()} feed: {e}")
+        info(f"Error loading {_HOST_U} feed: {e}")
         return releases
 
     elapsed_time = time.time() - start_time
@@ -135,21 +168,21 @@ def wcx_search(shared_state, start_time, request_from, search_string, mirror=Non
     wcx = shared_state.values["config"]("Hostnames").get(hostname.lower())
 
     if "lazylibrarian" in request_from.lower():
-        debug(f'Skipping {request_from} search on "{hostname.upper()}" (unsupported media type)!')
+        debug(f'Skipping {request_from} search on "{_HOST_U}" (unsupported media type)!')
         return releases
 
     # Handle IMDb ID
     imdb_id = shared_state.is_imdb_id(search_string)
     if imdb_id:
-        info(f"{hostname.upper()}: Received IMDb ID: {imdb_id}")
-        title = get_localized_title(shared_state, imdb_id, 'de')
+        info(f"{_HOST_U}: Received IMDb ID: {imdb_id}")
+        title = get_cached_localized_title(shared_state, imdb_id, 'de')
         if not title:
-            info(f"{hostname.upper()}: no title for IMDb {imdb_id}")
+            info(f"{_HOST_U}: no title for IMDb {imdb_id}")
             return releases
-        info(f"{hostname.upper()}: Translated IMDb {imdb_id} to German title: '{title}'")
+        info(f"{_HOST_U}: Translated IMDb {imdb_id} to German title: '{title}'")
         search_string = html.unescape(title)
     else:
-        info(f"{hostname.upper()}: Using search string directly: '{search_string}'")
+        info(f"{_HOST_U}: Using search string directly: '{search_string}'")
 
     # === STEP 1: Search API ===
     api_url = f'https://api.{wcx}/start/search'
@@ -180,46 +213,80 @@ def wcx_search(shared_state, start_time, request_from, search_string, mirror=Non
     elif "radarr" in request_from.lower():
         params['types'] = 'movie'
 
-    info(f"{hostname.upper()}: Searching: '{search_string}'")
+    info(f"{_HOST_U}: Searching: '{search_string}'")
 
     try:
         # Get search results
-        response = requests.get(api_url, headers=headers, params=params, timeout=10)
+        response = _session.get(api_url, headers=headers, params=params, timeout=10)
         
         if response.status_code != 200:
-            info(f"{hostname.upper()}: Search API returned status {response.status_code}")
+            info(f"{_HOST_U}: Search API returned status {response.status_code}")
             return releases
         
         data = response.json()
-        
-        # Extract items from response
-        if 'items' in data and 'data' in data['items']:
-            items = data['items']['data']
-        elif 'data' in data:
-            items = data['data']
-        elif 'results' in data:
-            items = data['results']
+
+        # Extract items from response with a single walk over the known shapes
+        if isinstance(data, list):
+            items = data
         else:
-            items = data if isinstance(data, list) else []
-        
-        info(f"{hostname.upper()}: Found {len(items)} items in search results")
-        
+            items_container = data.get('items')
+            if isinstance(items_container, dict) and 'data' in items_container:
+                items = items_container['data']
+            else:
+                items = data.get('data') or data.get('results') or []
+
+        info(f"{_HOST_U}: Found {len(items)} items in search results")
+
+        if not items:
+            return releases
+
+        # Constant for every release produced by this search; local bindings
+        # avoid re-resolving the shared_state attribute chain per item
+        download_prefix = f"{shared_state.values['internal_address']}/download/?payload="
+        is_valid_release = shared_state.is_valid_release
+        # Checked once so per-item debug f-strings are only built when the
+        # messages would actually be printed
+        debug_active = debug_enabled()
+
         # === STEP 2: Fetch details for each UID ===
+        uids = []
+        seen_uids = set()
         for item in items:
+            uid = item.get('uid')
+            if not uid:
+                if debug_active:
+                    debug(f"{_HOST_U}: Item has no UID, skipping")
+                continue
+            if uid in seen_uids:
+                if debug_active:
+                    debug(f"{_HOST_U}: Duplicate UID {uid}, skipping")
+                continue
+            seen_uids.add(uid)
+            uids.append(uid)
+
+        # The detail fetches are independent and I/O-bound, so run them
+        # concurrently; executor.map keeps the responses in UID order.
+        def _fetch_detail(detail_uid):
+            info(f"{_HOST_U}: Fetching details for UID: {detail_uid}")
             try:
-                uid = item.get('uid')
-                if not uid:
-                    debug(f"{hostname.upper()}: Item has no UID, skipping")
-                    continue
-                
-                info(f"{hostname.upper()}: Fetching details for UID: {uid}")
-                
                 # Fetch detail using correct API endpoint: /start/d/{uid}
-                detail_url = f'https://api.{wcx}/start/d/{uid}'
-                detail_response = requests.get(detail_url, headers=headers, timeout=10)
-                
+                return _session.get(f'https://api.{wcx}/start/d/{detail_uid}', headers=headers, timeout=10)
+            except Exception as e:
+                debug(f"{_HOST_U}: Detail fetch failed for {detail_uid}: {e}")
+                return None
+
+        detail_responses = []
+        if uids:
+            with ThreadPoolExecutor(max_workers=min(len(uids), 8)) as executor:
+                detail_responses = list(executor.map(_fetch_detail, uids))
+
+        for uid, detail_response in zip(uids, detail_responses):
+            try:
+                if detail_response is None:
+                    continue
+
                 if detail_response.status_code != 200:
-                    debug(f"{hostname.upper()}: Detail API returned {detail_response.status_code} for {uid}")
+                    debug(f"{_HOST_U}: Detail API returned {detail_response.status_code} for {uid}")
                     continue
                 
                 detail_data = detail_response.json()
@@ -245,16 +312,14 @@ def wcx_search(shared_state, start_time, request_from, search_string, mirror=Non
                     title = html.unescape(main_title)
                     title = title.replace(' ', '.')
                     
-                    if shared_state.is_valid_release(title, request_from, search_string, season, episode):
-                        info(f"{hostname.upper()}: ✓ Adding main release: {title}")
+                    if is_valid_release(title, request_from, search_string, season, episode):
+                        info(f"{_HOST_U}: ✓ Adding main release: {title}")
                         
                         published = detail_item.get('updated_at') or detail_item.get('created_at') or ''
                         password = f"www.{wcx}"
                         
-                        payload = urlsafe_b64encode(
-                            f"{title}|{source}|{mirror}|0|{password}|{item_imdb_id or ''}".encode("utf-8")
-                        ).decode("utf-8")
-                        link = f"{shared_state.values['internal_address']}/download/?payload={payload}"
+                        payload = _make_payload(title, source, mirror, 0, password, item_imdb_id)
+                        link = download_prefix + payload
                         
                         releases.append({
                             "details": {
@@ -272,7 +337,7 @@ def wcx_search(shared_state, start_time, request_from, search_string, mirror=Non
                 
                 # CRITICAL: Process releases array (contains different quality versions)
                 if 'releases' in detail_item and isinstance(detail_item['releases'], list):
-                    info(f"{hostname.upper()}: Found {len(detail_item['releases'])} releases for {uid}")
+                    info(f"{_HOST_U}: Found {len(detail_item['releases'])} releases for {uid}")
                     
                     for release in detail_item['releases']:
                         try:
@@ -285,11 +350,12 @@ def wcx_search(shared_state, start_time, request_from, search_string, mirror=Non
                             release_title = release_title.replace(' ', '.')
                             
                             # Validate release
-                            if not shared_state.is_valid_release(release_title, request_from, search_string, season, episode):
-                                debug(f"{hostname.upper()}: ✗ Release filtered out: {release_title}")
+                            if not is_valid_release(release_title, request_from, search_string, season, episode):
+                                if debug_active:
+                                    debug(f"{_HOST_U}: ✗ Release filtered out: {release_title}")
                                 continue
                             
-                            info(f"{hostname.upper()}: ✓ Adding release: {release_title}")
+                            info(f"{_HOST_U}: ✓ Adding release: {release_title}")
                             
                             # Get release-specific data
                             release_uid = release.get('uid')
@@ -303,10 +369,9 @@ def wcx_search(shared_state, start_time, request_from, search_string, mirror=Non
                             password = f"www.{wcx}"
                             
                             # Create payload
-                            payload = urlsafe_b64encode(
-                                f"{release_title}|{release_source}|{mirror}|{release_size}|{password}|{item_imdb_id or ''}".encode("utf-8")
-                            ).decode("utf-8")
-                            link = f"{shared_state.values['internal_address']}/download/?payload={payload}"
+                            payload = _make_payload(release_title, release_source, mirror,
+                                                    release_size, password, item_imdb_id)
+                            link = download_prefix + payload
                             
                             releases.append({
                                 "details": {
@@ -323,23 +388,22 @@ def wcx_search(shared_state, start_time, request_from, search_string, mirror=Non
                             })
                             
                         except Exception as e:
-                            debug(f"{hostname.upper()}: Error parsing release: {e}")
+                            debug(f"{_HOST_U}: Error parsing release: {e}")
                             continue
                 else:
-                    debug(f"{hostname.upper()}: No releases array found for {uid}")
+                    if debug_active:
+                        debug(f"{_HOST_U}: No releases array found for {uid}")
                 
             except Exception as e:
-                debug(f"{hostname.upper()}: Error processing item: {e}")
-                import traceback
-                debug(f"{hostname.upper()}: {traceback.format_exc()}")
+                debug(f"{_HOST_U}: Error processing item: {e}")
+                debug(f"{_HOST_U}: {traceback.format_exc()}")
                 continue
         
-        info(f"{hostname.upper()}: Returning {len(releases)} total releases")
+        info(f"{_HOST_U}: Returning {len(releases)} total releases")
         
     except Exception as e:
-        info(f"Error in {hostname.upper()} search: {e}")
-        import traceback
-        debug(f"{hostname.upper()}: {traceback.format_exc()}")
+        info(f"Error in {_HOST_U} search: {e}")
+        debug(f"{_HOST_U}: {traceback.format_exc()}")
         return releases
     
     elapsed_time = time.time() - start_time